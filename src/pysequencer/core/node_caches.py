@@ -1,5 +1,7 @@
-from typing import List
+from typing import List, Dict
 from enum import IntEnum
+from functools import lru_cache
+import os
 import re
 
 import unreal
@@ -8,19 +10,16 @@ ETL = unreal.EditorAssetLibrary()
 
 CACHE_CLASSES = ("LevelSequence", "StaticMesh", "Blueprint")
 
+_SCALAR_TYPES = {"bool": bool, "int32": int, "float": float}
 
-def find_matches(pattern: str, source: str) -> list or None:
-    finders = re.findall(pattern, source, re.MULTILINE)
-    return finders
+_CLASS_PROP_RE = re.compile(r"\((?P<property_type>\w+)\):  \[(?P<permission>[\w-]+)\] (?P<des>[\w ,'().\n\r\/:-]+)")
+_DESCRIPTION_RE = re.compile(r"[^(*)]+\.")
+_SOURCE_DATA_RE = re.compile(r"- \*\*(?P<name>\w+)\*\*: (?P<value>[\w.]+)")
+_EDITOR_PROP_LINE_RE = re.compile(r"- ``(?P<name>\w+)`` \((?P<property_type>[\w()]+)\):  \[(?P<permission>[\w-]+)\] (?P<des>.*)")
 
 
-def find_groups(pattern: str, source: str) -> list:
-    result = list()
-
-    for match in re.finditer(pattern, source, re.MULTILINE):
-        result.append(match.groupdict())
-
-    return result
+def find_groups(pattern: re.Pattern, source: str) -> list:
+    return [match.groupdict() for match in pattern.finditer(source)]
 
 
 class PropertyCategory(IntEnum):
@@ -32,61 +31,54 @@ class NodeCacheError(Exception):
     pass
 
 
-class PropertyTypeSingleton(type):
-    __CACHE_DATA = dict()
-
-    def __call__(cls, *args, **kwargs):
-        property_type = args[0] if args else kwargs.get("property_type", None)
-
-        if property_type not in cls.__CACHE_DATA:
-            cls.__CACHE_DATA[property_type] = super(PropertyTypeSingleton, cls).__call__(*args, **kwargs)
+class PropertyType:
+    __slots__ = ("name",)
 
-        return cls.__CACHE_DATA[property_type]
+    _TYPE_CACHE: Dict[str, type] = dict()
 
-
-class PropertyType(metaclass=PropertyTypeSingleton):
     def __init__(self, property_type: str):
         self.name = property_type
-        self._type = None
 
     @property
     def type(self):
-        if self._type is None:
-            ins_type = None
-
-            if self.name == "bool":
-                ins_type = bool
-            elif self.name == "int32":
-                ins_type = int
-            elif self.name == "float":
-                ins_type = float
-            elif self.name.startswith("Array("):
-                pattern = r"Array\((?P<sub_type>.+)\)"
-                groups = find_groups(pattern, self.name)
-                if groups:
-                    sub_type = getattr(unreal, groups[0]["sub_type"], None)
+        ins_type = self._TYPE_CACHE.get(self.name)
+
+        if ins_type is None:
+            name = self.name
+            ins_type = _SCALAR_TYPES.get(name)
+
+            if ins_type is None:
+                if name.startswith("Array(") and name.endswith(")"):
+                    sub_type = getattr(unreal, name[6:-1], None)
                     if sub_type is not None:
                         ins_type = List[sub_type]
-            else:
-                ins_type = getattr(unreal, self.name, None)
+                else:
+                    ins_type = getattr(unreal, name, None)
 
             if ins_type is not None:
-                self._type = ins_type
+                self._TYPE_CACHE[name] = ins_type
 
-        return self._type
+        return ins_type
 
     def __repr__(self):
         return f"<Property Type: {self.name}, {self.type}>"
 
 
+@lru_cache(maxsize=None)
+def _property_type(name: str) -> PropertyType:
+    return PropertyType(name)
+
+
 class PropertyError(Exception):
     pass
 
 
 class NodeCachePropertyBase:
+    __slots__ = ("name", "property_type", "permission", "des", "parent", "_is_write", "category")
+
     def __init__(self, name: str, property_type: str, permission: str, des: str, parent: unreal.Object):
         self.name = name
-        self.property_type = PropertyType(property_type)
+        self.property_type = _property_type(property_type)
         self.permission = permission
         self.des = des
 
@@ -107,6 +99,8 @@ class NodeCachePropertyBase:
 
 
 class NodeCacheEditorProperty(NodeCachePropertyBase):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(NodeCacheEditorProperty, self).__init__(*args, **kwargs)
         self.category = PropertyCategory.EDITOR
@@ -122,6 +116,8 @@ class NodeCacheEditorProperty(NodeCachePropertyBase):
 
 
 class NodeCacheClassProperty(NodeCachePropertyBase):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(NodeCacheClassProperty, self).__init__(*args, **kwargs)
         self.category = PropertyCategory.CLASS
@@ -136,21 +132,9 @@ class NodeCacheClassProperty(NodeCachePropertyBase):
         raise PropertyError(f"Property {self.name} is {self.permission}")
 
 
-class PropertySingleton(type):
-    __CACHE_DATA = dict()
-
-    def __call__(cls, *args, **kwargs):
-        ins = args[0] if args else kwargs.get("property_ins", None)
-        subject = args[1] if args else kwargs.get("subject", None)
+class NodeCacheProperty:
+    __slots__ = ("_property", "_subject")
 
-        key = f"{id(subject)}_{ins.name}_{ins.category}"
-        if key not in cls.__CACHE_DATA:
-            cls.__CACHE_DATA[key] = super(PropertySingleton, cls).__call__(*args, **kwargs)
-
-        return cls.__CACHE_DATA[key]
-
-
-class NodeCacheProperty(metaclass=PropertySingleton):
     def __init__(self, property_ins: NodeCacheEditorProperty or NodeCacheClassProperty, subject):
         self._property = property_ins
         self._subject = subject
@@ -178,32 +162,40 @@ class NodeCacheProperty(metaclass=PropertySingleton):
         return f"<NodeCacheProperty {body} {id(self)}>"
 
 
-class NodeCacheSingleton(type):
-    __CACHE_DATA = dict()
-
-    def __call__(cls, *args, **kwargs):
-        node_type = args[0] if args else kwargs.get("node_type", None)
-        if node_type is None or not getattr(unreal, node_type, None):
-            raise NodeCacheError("node_type is missing...")
+def _property_map(properties: List[NodeCachePropertyBase] or None) -> dict:
+    result = dict()
+    for prop in properties or ():
+        result.setdefault(prop.name, prop)
 
-        if node_type not in cls.__CACHE_DATA:
-            cls.__CACHE_DATA[node_type] = super(NodeCacheSingleton, cls).__call__(*args, **kwargs)
+    return result
 
-        return cls.__CACHE_DATA[node_type]
 
+class NodeCache:
+    __slots__ = (
+        "node_type",
+        "_node_cls",
+        "_doc",
+        "_doc_scanned",
+        "_des",
+        "_source_data",
+        "_editor_properties",
+        "_editor_property_map",
+        "_class_properties",
+        "_class_property_map",
+    )
 
-class NodeCache(metaclass=NodeCacheSingleton):
     def __init__(self, node_type: str):
         self.node_type = node_type
 
         self._node_cls = getattr(unreal, node_type)
         self._doc = None
+        self._doc_scanned = False
         self._des = None
         self._source_data = None
         self._editor_properties = None
-        self._editor_property_names = None
+        self._editor_property_map = None
         self._class_properties = None
-        self._class_property_names = None
+        self._class_property_map = None
 
     @property
     def doc(self) -> str:
@@ -212,99 +204,145 @@ class NodeCache(metaclass=NodeCacheSingleton):
 
         return self._doc
 
+    def _scan_doc(self) -> None:
+        """
+        Parse description, source data and editor properties from the class doc
+        """
+        if self._doc_scanned:
+            return
+
+        source_data = dict()
+        editor_properties = list()
+
+        match = _DESCRIPTION_RE.search(self.doc)
+        description = match.group(0) if match else None
+
+        # one walk over the doc lines collects both source data and editor properties
+        lines = self.doc.splitlines()
+        index = 0
+        while index < len(lines):
+            line = lines[index].strip()
+            index += 1
+
+            source = _SOURCE_DATA_RE.match(line)
+            if source is not None:
+                source_data[source.group("name")] = source.group("value")
+                continue
+
+            header = _EDITOR_PROP_LINE_RE.match(line)
+            if header is None:
+                continue
+
+            # slurp continuation lines until a blank line or the next list item
+            des = [header.group("des")]
+            while index < len(lines):
+                line = lines[index].strip()
+                if not line or line.startswith("- "):
+                    break
+                des.append(line)
+                index += 1
+
+            group = header.groupdict()
+            group["des"] = " ".join(des)
+            editor_properties.append(NodeCacheEditorProperty(parent=self, **group))
+
+        self._des = description
+        self._source_data = source_data or None
+        self._editor_properties = editor_properties or None
+        self._doc_scanned = True
+
     @property
     def description(self) -> str:
-        if self._des is None:
-            finders = find_matches(pattern=r"[^(**)]+[\.]", source=self.doc)
-            if finders:
-                self._des = finders[0]
-
+        self._scan_doc()
         return self._des
 
     @property
     def source_data(self) -> dict:
-        if self._source_data is None:
-            result = dict()
-            pattern = r"- \*\*(?P<name>\w+)\*\*: (?P<value>[\w.]+)"
-            for group in find_groups(pattern=pattern, source=self.doc):
-                result[group["name"]] = group["value"]
-            if result:
-                self._source_data = result
-
+        self._scan_doc()
         return self._source_data
 
     @property
     def editor_property_names(self) -> List[str]:
-        if self._editor_property_names is None:
-            self._editor_property_names = [x.name for x in self.editor_properties]
-        return self._editor_property_names
+        return list(self.editor_property_map.keys())
 
     @property
-    def editor_properties(self) -> List[NodeCacheEditorProperty]:
-        if self._editor_properties is None:
-            result = list()
-            pattern = r"- ``(?P<name>\w+)`` \((?P<property_type>[\w()]+)\):  \[(?P<permission>[\w-]+)\] (?P<des>[\w ,'().\n\r-]+)$"
-            for group in find_groups(pattern=pattern, source=self.doc):
-                result.append(NodeCacheEditorProperty(parent=self, **group))
-            if result:
-                self._editor_properties = result
+    def editor_property_map(self) -> Dict[str, NodeCacheEditorProperty]:
+        if self._editor_property_map is None:
+            self._editor_property_map = _property_map(self.editor_properties)
+
+        return self._editor_property_map
 
+    @property
+    def editor_properties(self) -> List[NodeCacheEditorProperty]:
+        self._scan_doc()
         return self._editor_properties
 
     @property
     def class_property_names(self) -> List[str]:
-        if self._class_property_names is None:
-            self._class_property_names = [x.name for x in self.class_properties]
+        return list(self.class_property_map.keys())
 
-        return self._class_property_names
+    @property
+    def class_property_map(self) -> Dict[str, NodeCacheClassProperty]:
+        if self._class_property_map is None:
+            self._class_property_map = _property_map(self.class_properties)
+
+        return self._class_property_map
 
     @property
     def class_properties(self) -> List[NodeCacheClassProperty]:
         if self._class_properties is None:
             result = list()
+            seen = set()
 
-            for attr in dir(self._node_cls):
-                if attr.startswith("__"):
-                    continue
-
-                attr_obj = getattr(self._node_cls, attr)
+            for klass in self._node_cls.__mro__:
+                for attr, attr_obj in klass.__dict__.items():
+                    if attr.startswith("__") or attr in seen:
+                        continue
+                    seen.add(attr)
 
-                if type(attr_obj).__name__ != "getset_descriptor":
-                    continue
+                    if type(attr_obj).__name__ != "getset_descriptor":
+                        continue
 
-                pattern = r"\((?P<property_type>\w+)\):  \[(?P<permission>[\w-]+)\] (?P<des>[\w ,'().\n\r\/:-]+)"
+                    # cheap check before running the regex, most descriptors have no property doc
+                    doc = attr_obj.__doc__
+                    if not doc or "):  [" not in doc:
+                        continue
 
-                for group in find_groups(pattern=pattern, source=attr_obj.__doc__):
-                    group["name"] = attr
-                    group["parent"] = self
-                    result.append(NodeCacheClassProperty(**group))
+                    for group in find_groups(pattern=_CLASS_PROP_RE, source=doc):
+                        group["name"] = attr
+                        group["parent"] = self
+                        result.append(NodeCacheClassProperty(**group))
 
-                if result:
-                    self._class_properties = result
+            if result:
+                self._class_properties = result
 
-            return self._class_properties
+        return self._class_properties
 
     def property_by_name(
         self, name: str, property_category: PropertyCategory = PropertyCategory.EDITOR
     ) -> NodeCacheEditorProperty or NodeCacheClassProperty:
         if property_category == PropertyCategory.EDITOR:
-            pool = self.editor_properties
-            names = self.editor_property_names
-        else:
-            pool = self.class_properties
-            names = self._class_property_names
+            return self.editor_property_map.get(name)
 
-        if name in names:
-            index = names.index(name)
-            return pool[index]
+        return self.class_property_map.get(name)
 
     def __repr__(self):
         return f"<{self.__class__.__name__} Type: {self.node_type}>"
 
 
+@lru_cache(maxsize=None)
+def node_cache(node_type: str) -> NodeCache:
+    if node_type is None or not getattr(unreal, node_type, None):
+        raise NodeCacheError("node_type is missing...")
+
+    return NodeCache(node_type)
+
+
 def _generate_default_caches():
     for name in CACHE_CLASSES:
-        NodeCache(name)
+        node_cache(name)
 
 
-_generate_default_caches()
+# caches are built on first use, set PYSEQUENCER_PREWARM to build the common ones at import time
+if os.environ.get("PYSEQUENCER_PREWARM"):
+    _generate_default_caches()
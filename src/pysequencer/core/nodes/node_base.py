@@ -1,7 +1,7 @@
 from typing import List
 from pysequencer.ue_helpers import AES, EAL
 
-from pysequencer.core.node_caches import NodeCache, PropertyCategory, NodeCacheProperty, ETL
+from pysequencer.core.node_caches import node_cache, PropertyCategory, NodeCacheProperty, ETL
 
 
 class NodeError(Exception):
@@ -13,9 +13,11 @@ class NodeMissAttr:
 
 
 class NodeBase:
+    __slots__ = ("node_type", "_ins_cache", "_node")
+
     def __init__(self, node_type: str = None):
         self.node_type = node_type
-        self._ins_cache = NodeCache(node_type)
+        self._ins_cache = node_cache(node_type)
         self._node = None
 
     @property
@@ -35,17 +37,21 @@ class NodeBase:
         return self._ins_cache.doc
 
     def __getattr__(self, item):
-        ins = getattr(self, item, NodeMissAttr)
-        if ins is NodeMissAttr:
-            ins = getattr(self._node, item, NodeMissAttr)
+        # only called after normal lookup failed, forward the miss to the unreal node
+        if item == "_node":
+            raise AttributeError(item)
 
+        ins = getattr(self._node, item, NodeMissAttr)
         if ins is NodeMissAttr:
-            return super(NodeBase, self).__getattr__(item)
-        else:
-            return ins
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{item}'")
+
+        return ins
 
     def property(self, name: str, property_category: PropertyCategory = PropertyCategory.EDITOR) -> NodeCacheProperty:
         p = self._ins_cache.property_by_name(name, property_category)
+        if p is None:
+            raise NodeError(f"Property is not exist: {name}")
+
         return NodeCacheProperty(p, self._node)
 
     def __repr__(self):
@@ -54,6 +60,8 @@ class NodeBase:
 
 
 class AssetNode(NodeBase):
+    __slots__ = ("_path",)
+
     def __init__(self, path: str):
         """
         Init Asset Node.
@@ -104,4 +112,4 @@ class AssetNode(NodeBase):
 
 class ActorNode(NodeBase):
     # todo Actor
-    pass
+    __slots__ = ()
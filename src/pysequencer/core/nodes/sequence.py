@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import List
+from typing import List, Dict
 from enum import IntEnum
 import pathlib
 
@@ -19,13 +19,36 @@ class LevelSequenceNodeError(Exception):
 
 
 class SequenceCamera:
+    __slots__ = ("_proxy", "_sequence", "_start", "_end", "_key_frames_data")
+
     def __init__(self, proxy: unreal.SequencerBindingProxy):
         self._proxy = proxy
-        self._sequence = LevelSequenceNode(proxy.sequence.get_full_name())
+        self._sequence = None
         self._start = None
         self._end = None
         self._key_frames_data = None
 
+    @classmethod
+    def _from_sequence(cls, proxy: unreal.SequencerBindingProxy, sequence: LevelSequenceNode) -> SequenceCamera:
+        """
+        Init SequenceCamera with the level sequence node it belongs to, skips loading the sequence asset again
+        """
+        camera = cls(proxy)
+        camera._sequence = sequence
+        return camera
+
+    @staticmethod
+    def _fbx_import_settings() -> unreal.MovieSceneUserImportFBXSettings:
+        """
+        Fbx settings used to import camera keyframes
+        """
+        camera_settings = unreal.MovieSceneUserImportFBXSettings()
+        camera_settings.set_editor_property("create_cameras", False)
+        camera_settings.set_editor_property("force_front_x_axis", False)
+        camera_settings.set_editor_property("match_by_name_only", False)
+        camera_settings.set_editor_property("reduce_keys", False)
+        return camera_settings
+
     @classmethod
     def import_camera(
         cls,
@@ -35,6 +58,8 @@ class SequenceCamera:
         name: str = None,
         start_frame: int = None,
         new_section: bool = True,
+        camera_settings: unreal.MovieSceneUserImportFBXSettings = None,
+        current_world: unreal.World = None,
     ) -> SequenceCamera or None:
         """
         Import Fbx Camera To Level Sequence
@@ -44,27 +69,57 @@ class SequenceCamera:
         :param name: camera name
         :param start_frame: start frame
         :param new_section: set camera cut section
+        :param camera_settings: fbx import settings, created when not given
+        :param current_world: editor world, queried when not given
         :return: Sequence Camera object
         """
+        fbx_path = pathlib.Path(fbx_path)
+
+        return cls._import_camera(
+            fbx_path=fbx_path.as_posix(),
+            sequence=sequence,
+            proxy=proxy,
+            name=name or fbx_path.stem,
+            start_frame=start_frame,
+            new_section=new_section,
+            camera_settings=camera_settings,
+            current_world=current_world,
+        )
+
+    @classmethod
+    def _import_camera(
+        cls,
+        fbx_path: str,
+        sequence: LevelSequenceNode,
+        proxy: unreal.SequencerBindingProxy,
+        name: str,
+        start_frame: int = None,
+        new_section: bool = True,
+        camera_settings: unreal.MovieSceneUserImportFBXSettings = None,
+        current_world: unreal.World = None,
+        section_objects: dict = None,
+    ) -> SequenceCamera or None:
+        """
+        Import Fbx Camera To Level Sequence, the fbx path is already in posix form and name is resolved
+        :param section_objects: cache of camera cut section bound objects, shared by a batch import
+        """
         from pysequencer.ue_helpers import ELL
 
         sequence.open()
 
-        fbx_path = pathlib.Path(fbx_path)
-
         # import camera settings
-        camera_settings = unreal.MovieSceneUserImportFBXSettings()
-        camera_settings.set_editor_property("create_cameras", False)
-        camera_settings.set_editor_property("force_front_x_axis", False)
-        camera_settings.set_editor_property("match_by_name_only", False)
-        camera_settings.set_editor_property("reduce_keys", False)
+        if camera_settings is None:
+            camera_settings = cls._fbx_import_settings()
 
         # current world
-        current_world = ELL.get_editor_world()
+        if current_world is None:
+            current_world = ELL.get_editor_world()
 
-        # setup camera name
-        if name is None:
-            name = fbx_path.stem
+        # re-importing may respawn the camera, drop cached sections still bound to its old objects
+        if proxy and section_objects:
+            old_objects = LS_BP_LIB.get_bound_objects(proxy.get_binding_id())
+            for section in [x for x, objects in section_objects.items() if objects and objects == old_objects]:
+                del section_objects[section]
 
         # if camera is not exist in sequence, add a camera actor to sequence
         cam_actor = None
@@ -74,7 +129,7 @@ class SequenceCamera:
             proxy = sequence.node.add_spawnable_from_instance(cam_actor)
 
         import_status = unreal.SequencerTools.import_level_sequence_fbx(
-            current_world, sequence.node, [proxy], camera_settings, fbx_path.as_posix()
+            current_world, sequence.node, [proxy], camera_settings, fbx_path
         )
 
         # delete camera actor
@@ -82,7 +137,7 @@ class SequenceCamera:
             cam_actor.destroy_actor()
 
         # init SequenceCamera object
-        camera = cls(proxy)
+        camera = cls._from_sequence(proxy, sequence)
         if not import_status or camera is None:
             return
 
@@ -92,13 +147,17 @@ class SequenceCamera:
 
         # add a section set current camera
         if new_section:
-            sections = camera.camera_cut_sections
+            sections = camera._find_camera_cut_sections(section_objects)
             if not sections:
                 sections = [sequence.camera_cut_track.add_section()]
 
+            binding_id = camera.proxy.get_binding_id()
+            cam_start, cam_end = camera.start, camera.end
             for section in sections:
-                section.set_camera_binding_id(camera.proxy.get_binding_id())
-                section.set_range(camera.start, camera.end)
+                section.set_camera_binding_id(binding_id)
+                section.set_range(cam_start, cam_end)
+                if section_objects is not None:
+                    section_objects.pop(section, None)
 
         return camera
 
@@ -110,6 +169,15 @@ class SequenceCamera:
     def name(self) -> str:
         return str(self.proxy.get_display_name())
 
+    @property
+    def sequence(self) -> LevelSequenceNode:
+        """
+        The level sequence node of current camera
+        """
+        if self._sequence is None:
+            self._sequence = LevelSequenceNode(self.proxy.sequence.get_full_name())
+        return self._sequence
+
     @property
     def start(self) -> int:
         """
@@ -133,17 +201,29 @@ class SequenceCamera:
         """
         Get camera cut sections from current sequence's camera cut track
         """
+        return self._find_camera_cut_sections()
+
+    def _find_camera_cut_sections(self, section_objects: dict = None) -> List[unreal.MovieSceneCameraCutSection]:
+        """
+        Get camera cut sections bound to current camera
+        :param section_objects: cache of section bound objects, shared by the cameras of one batch import
+        """
+        if section_objects is None:
+            section_objects = dict()
+
         result = list()
-        camera_cut_track = self._sequence.camera_cut_track
+        camera_cut_track = self.sequence.camera_cut_track
         camera_objects = LS_BP_LIB.get_bound_objects(self.proxy.get_binding_id())
 
         for section in camera_cut_track.get_sections():
             if not isinstance(section, unreal.MovieSceneCameraCutSection):
                 continue
 
-            section_binding_id = section.get_camera_binding_id()
-            section_objects = LS_BP_LIB.get_bound_objects(section_binding_id)
-            if section_objects and section_objects == camera_objects:
+            if section not in section_objects:
+                section_objects[section] = LS_BP_LIB.get_bound_objects(section.get_camera_binding_id())
+
+            bound_objects = section_objects[section]
+            if bound_objects and bound_objects == camera_objects:
                 result.append(section)
 
         return result
@@ -153,20 +233,26 @@ class SequenceCamera:
         Set start frame of current camera keyframes
         :param start: start frame number
         """
-        offset = start - self.start
+        cam_start = self.start
+        offset = start - cam_start
 
-        for ch, keys in self._key_frames_data.items():
-            ch_start = keys[0].get_time().frame_number.value
+        for ch, (keys, ch_start, ch_end) in self._key_frames_data.items():
+            shift = cam_start - ch_start + offset
 
-            sub_offset = self.start - ch_start
-            for key in keys:
-                current_frame = key.get_time().frame_number.value
-                new_frame = current_frame + sub_offset + offset
+            # first and last frames are already known from the camera data
+            frames = [ch_start] + [key.get_time().frame_number.value for key in keys[1:-1]]
+            if len(keys) > 1:
+                frames.append(ch_end)
 
-                new_time = unreal.FrameNumber(value=new_frame)
+            for key, current_frame in zip(keys, frames):
+                new_time = unreal.FrameNumber(value=current_frame + shift)
                 key.set_time(new_time)
 
-        self.__setup_camera_data()
+            self._key_frames_data[ch] = (keys, ch_start + shift, ch_end + shift)
+
+        # keep the cached range in sync instead of reading the keys back
+        self._start = min(x[1] for x in self._key_frames_data.values())
+        self._end = max(x[2] for x in self._key_frames_data.values())
 
     def __setup_camera_data(self) -> None:
         """
@@ -175,8 +261,8 @@ class SequenceCamera:
 
         self._key_frames_data = dict()
 
-        start = None
-        end = None
+        starts: List[int] = list()
+        ends: List[int] = list()
 
         proxies = self.proxy.get_child_possessables()
         proxies.append(self.proxy)
@@ -187,21 +273,23 @@ class SequenceCamera:
                     for ch in section.get_channels():
                         keys = ch.get_keys()
                         if keys:
-                            self._key_frames_data[ch] = keys
-                            key_start = keys[0].get_time().frame_number.value
-                            key_end = keys[-1].get_time().frame_number.value
-                            if start is None or start > key_start:
-                                start = key_start
-                            if end is None or end < key_end:
-                                end = key_end
-        self._start = start
-        self._end = end
+                            # channel keys are in time order, the first and last key give its range
+                            ch_start = keys[0].get_time().frame_number.value
+                            ch_end = keys[-1].get_time().frame_number.value if len(keys) > 1 else ch_start
+                            self._key_frames_data[ch] = (keys, ch_start, ch_end)
+                            starts.append(ch_start)
+                            ends.append(ch_end)
+
+        self._start = min(starts) if starts else None
+        self._end = max(ends) if ends else None
 
     def __repr__(self):
         return f"<SequenceCamera name={self.name} start={self.start} end={self.end}>"
 
 
 class LevelSequenceNode(AssetNode):
+    __slots__ = ()
+
     @property
     def start(self) -> int:
         return self.node.get_playback_start()
@@ -257,7 +345,17 @@ class LevelSequenceNode(AssetNode):
         result = list()
         for x in self.node.get_spawnables():
             if isinstance(x.get_object_template(), unreal.CineCameraActor):
-                result.append(SequenceCamera(x))
+                result.append(SequenceCamera._from_sequence(x, self))
+        return result
+
+    def _camera_proxies(self) -> Dict[str, unreal.SequencerBindingProxy]:
+        """
+        Map camera name to binding proxy for the cameras in current sequence
+        """
+        result = dict()
+        for x in self.node.get_spawnables():
+            if isinstance(x.get_object_template(), unreal.CineCameraActor):
+                result.setdefault(str(x.get_display_name()), x)
         return result
 
     @property
@@ -278,18 +376,19 @@ class LevelSequenceNode(AssetNode):
     @classmethod
     def sequence(cls, path: str, create_new: bool = True) -> LevelSequenceNode or None:
         path = pathlib.Path(path)
+        posix = path.as_posix()
 
-        if not EAL.does_asset_exist(path.as_posix()) and create_new:
+        if not EAL.does_asset_exist(posix) and create_new:
             ATH.get_asset_tools().create_asset(
                 asset_name=path.stem,
                 package_path=path.parent.as_posix(),
                 asset_class=unreal.LevelSequence,
                 factory=unreal.LevelSequenceFactoryNew(),
             )
-            EAL.save_asset(path.as_posix())
+            EAL.save_asset(posix)
 
-        if EAL.does_asset_exist(path.as_posix()):
-            return cls(path.as_posix())
+        if EAL.does_asset_exist(posix):
+            return cls(posix)
 
     def add_camera(
         self, fbx_path: str, name: str = None, start_frame: int = None, match_camera_name: bool = True
@@ -302,26 +401,48 @@ class LevelSequenceNode(AssetNode):
         :param match_camera_name: Is match current sequence camera track name
         :return: SequenceCamera object
         """
-        fbx_path = pathlib.Path(fbx_path)
+        camera_proxies = self._camera_proxies() if match_camera_name else None
+        return self._add_camera(fbx_path, name, start_frame, camera_proxies)
 
-        name = name or fbx_path.stem
-        camera_proxy = None
+    def _add_camera(
+        self,
+        fbx_path: str,
+        name: str = None,
+        start_frame: int = None,
+        camera_proxies: Dict[str, unreal.SequencerBindingProxy] = None,
+        camera_settings: unreal.MovieSceneUserImportFBXSettings = None,
+        current_world: unreal.World = None,
+        section_objects: dict = None,
+    ) -> SequenceCamera:
+        """
+        Import fbx camera to current level sequence
+        :param camera_proxies: existing camera proxies by name to match, updated with the imported camera
+        :param camera_settings: fbx import settings shared by a batch import
+        :param current_world: editor world shared by a batch import
+        :param section_objects: camera cut section bound objects shared by a batch import
+        """
+        path = pathlib.Path(fbx_path)
+        fbx_path = path.as_posix()
 
-        if match_camera_name:
-            camera = next((x for x in self.cameras if x.name == name), None)
-            if camera:
-                camera_proxy = camera.proxy
+        name = name or path.stem
+        camera_proxy = camera_proxies.get(name) if camera_proxies is not None else None
 
-        camera = SequenceCamera.import_camera(
-            fbx_path=fbx_path.as_posix(),
+        camera = SequenceCamera._import_camera(
+            fbx_path=fbx_path,
             sequence=self,
             proxy=camera_proxy,
             name=name,
             start_frame=start_frame,
+            camera_settings=camera_settings,
+            current_world=current_world,
+            section_objects=section_objects,
         )
 
         if camera is None:
-            raise LevelSequenceNodeError(f"Import camera fbx is error {fbx_path.as_posix()}")
+            raise LevelSequenceNodeError(f"Import camera fbx is error {fbx_path}")
+
+        if camera_proxies is not None:
+            camera_proxies.setdefault(camera.name, camera.proxy)
 
         return camera
 
@@ -342,25 +463,38 @@ class LevelSequenceNode(AssetNode):
         :param auto_frame_range: Auto set frame range for sequence
         :return: A list of SequenceCamera object
         """
+        from pysequencer.ue_helpers import ELL
+
+        # validate every entry before importing, the list also lets one-shot iterables be walked twice
+        cameras = list(cameras)
+        for camera_data in cameras:
+            if len(camera_data) != 1:
+                raise LevelSequenceNodeError(f"Camera data must be a single camera_name: fbx_path item: {camera_data}")
+
         result = list()
         start = start_frame
         end = None
+        camera_proxies = self._camera_proxies() if match_camera_name else None
+        camera_settings = SequenceCamera._fbx_import_settings()
+        current_world = ELL.get_editor_world()
+        # camera cut section -> bound objects, shared by the cameras of this batch
+        section_objects = dict()
 
         for camera_data in cameras:
-            for camera_name, camera_path in camera_data.items():
-                camera = self.add_camera(
-                    camera_path, camera_name, start_frame=start_frame, match_camera_name=match_camera_name
-                )
-
-                if camera:
-                    start_frame = camera.end + 1 if order == order.one_by_one else start_frame
-                    result.append(camera)
-                    if auto_frame_range:
-                        if end is None or order == CameraOrder.one_by_one:
-                            end = camera.end
-                        elif end < camera.end:
-                            end = camera.end
-                break
+            camera_name, camera_path = next(iter(camera_data.items()))
+            camera = self._add_camera(
+                camera_path, camera_name, start_frame, camera_proxies, camera_settings, current_world, section_objects
+            )
+
+            if camera:
+                cam_end = camera.end
+                start_frame = cam_end + 1 if order == order.one_by_one else start_frame
+                result.append(camera)
+                if auto_frame_range:
+                    if end is None or order == CameraOrder.one_by_one:
+                        end = cam_end
+                    elif end < cam_end:
+                        end = cam_end
 
         if auto_frame_range:
             self.start = start